@@ -13,7 +13,12 @@ from rules import (
 
 # Try to import Rule 4 — only available in V2
 try:
-    from rules_v2 import rule4_edge_detection
+    from rules_v2 import (
+        compute_edge_signature,
+        prepare_edge_query,
+        rule4_chamfer_edge,
+        rule4_edge_detection,
+    )
     V2_AVAILABLE = True
 except ImportError:
     V2_AVAILABLE = False
@@ -22,9 +27,14 @@ except ImportError:
 class SimpleDetective:
     """An expert system that matches modified images to originals."""
 
-    def __init__(self, use_v2=False):
+    def __init__(self, use_v2=False, edge_backend="template"):
+        if edge_backend not in ("template", "chamfer"):
+            raise ValueError(f"Unknown edge backend: {edge_backend}")
         self.targets = {}
         self.use_v2 = use_v2 and V2_AVAILABLE  # only use V2 if available
+        # Rule 4 backend: "template" (matchTemplate on edge maps) or
+        # "chamfer" (distance transforms precomputed at registration)
+        self.edge_backend = edge_backend
 
     def register_targets(self, folder):
         """Load original images and compute signatures."""
@@ -41,6 +51,8 @@ class SimpleDetective:
                     "size": file_size,
                     **basic_info,
                 }
+                if self.use_v2 and self.edge_backend == "chamfer":
+                    self.targets[filename]["edge_sig"] = compute_edge_signature(filepath)
                 print(f"  Registered: {filename} ({file_size} bytes)")
 
         print(f"Total targets: {len(self.targets)}\n")
@@ -53,6 +65,9 @@ class SimpleDetective:
         """
         basename = os.path.basename(input_image_path)
         input_info = get_basic_image_info(input_image_path)
+        edge_query = None
+        if self.use_v2 and self.edge_backend == "chamfer":
+            edge_query = prepare_edge_query(input_image_path)
         results = []
 
         # ---- Loop: run rules for every target, collect results ----
@@ -67,7 +82,12 @@ class SimpleDetective:
                 target_info, input_image_path
             )
 
-            if self.use_v2:
+            if self.use_v2 and self.edge_backend == "chamfer":
+                r4_score, r4_fired, r4_ev = rule4_chamfer_edge(
+                    target_info, input_image_path, query=edge_query
+                )
+                total = r1_score + r2_score + r3_score + r4_score  # max 120
+            elif self.use_v2:
                 r4_score, r4_fired, r4_ev = rule4_edge_detection(
                     target_info, input_image_path
                 )
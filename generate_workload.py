@@ -0,0 +1,296 @@
+"""
+EAS 510 - Synthetic Workload Generator
+Builds a scaled-up, reproducible test set for benchmarking find_best_match().
+
+Variants use the same transformation families as hard/ (v1..v6), and
+random distractors are labelled null in ground_truth.json, as in the repo.
+
+Output layout:
+    <out>/originals/             targets to register (downscaled copies)
+    <out>/variants/NNNN/...      modified images, sharded into sub-folders
+    <out>/random/NNNN/...        unrelated distractors
+    <out>/ground_truth.json      {relative path: original stem or null}
+
+Example:
+    python generate_workload.py --source originals --out workload_10k -n 10000
+"""
+import argparse
+import json
+import os
+import random
+from multiprocessing import Pool
+
+import numpy as np  # type: ignore
+from PIL import Image, ImageDraw, ImageEnhance  # type: ignore
+
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png")
+MIN_SIDE   = 64   # smallest --max-side that still leaves room for every family
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _quality(rng):
+    return rng.randrange(25, 80, 5)
+
+
+def _center_crop(img, keep):
+    w, h = img.size
+    cw, ch = int(w * keep), int(h * keep)
+    left, top = (w - cw) // 2, (h - ch) // 2
+    return img.crop((left, top, left + cw, top + ch))
+
+
+def load_sources(folder, max_side):
+    """Load source images as RGB, downscaled so the longest side <= max_side."""
+    sources = []
+    seen = {}
+    for filename in sorted(os.listdir(folder)):
+        if not filename.lower().endswith(IMAGE_EXTS):
+            continue
+        # Stems are the ground-truth labels and originals/ file names
+        stem = os.path.splitext(filename)[0]
+        if stem in seen:
+            raise ValueError(
+                f"Duplicate source stem '{stem}': {seen[stem]} and {filename}"
+            )
+        seen[stem] = filename
+        with Image.open(os.path.join(folder, filename)) as img:
+            img = img.convert("RGB")
+            if max(img.size) > max_side:
+                img.thumbnail((max_side, max_side), Image.LANCZOS)
+            sources.append((stem, img.copy()))
+    return sources
+
+
+# ---------------------------------------------------------------------------
+# Transformation families — names mirror the hard/ filenames
+# Each takes (img, rng) and returns (img, name_parts, jpeg_quality)
+# ---------------------------------------------------------------------------
+
+def v1_crop_offcenter(img, rng):
+    keep = rng.randrange(55, 80, 5) / 100
+    w, h = img.size
+    cw, ch = int(w * keep), int(h * keep)
+    left, top = rng.randint(0, w - cw), rng.randint(0, h - ch)
+    q = _quality(rng)
+    img = img.crop((left, top, left + cw, top + ch))
+    return img, [f"crop_offcenter_keep{int(keep * 100)}", "compress", f"q{q}"], q
+
+
+def v2_crop_bright(img, rng):
+    keep = rng.randrange(60, 80, 5) / 100
+    q = _quality(rng)
+    img = _center_crop(img, keep)
+    img = ImageEnhance.Brightness(img).enhance(rng.uniform(1.15, 1.5))
+    return img, [f"crop_keep{int(keep * 100)}", "bright", "compress", f"q{q}"], q
+
+
+def v3_resize_scale(img, rng):
+    """Scale content inside the original canvas: < 100 letterboxes, > 100 zooms."""
+    scale = rng.choice([75, 80, 85, 90, 110, 114, 120])
+    q = _quality(rng)
+    w, h = img.size
+    sw, sh = int(w * scale / 100), int(h * scale / 100)
+    scaled = img.resize((sw, sh), Image.LANCZOS)
+    if scale < 100:
+        canvas = Image.new("RGB", (w, h))
+        canvas.paste(scaled, ((w - sw) // 2, (h - sh) // 2))
+        img = canvas
+    else:
+        left, top = (sw - w) // 2, (sh - h) // 2
+        img = scaled.crop((left, top, left + w, top + h))
+    return img, [f"resize_scale{scale}", "compress", f"q{q}"], q
+
+
+def v4_rotate(img, rng):
+    angle = rng.choice([-6, -5, -4, -3, 3, 4, 5, 6])
+    q = _quality(rng)
+    img = img.rotate(angle, resample=Image.BICUBIC, expand=False)
+    return img, [f"rotate{angle}deg", "compress", f"q{q}"], q
+
+
+def v5_contrast(img, rng):
+    factor = rng.choice([rng.uniform(0.6, 0.8), rng.uniform(1.3, 1.7)])
+    q = _quality(rng)
+    img = ImageEnhance.Contrast(img).enhance(factor)
+    return img, ["contrast", "compress", f"q{q}"], q
+
+
+def v6_crop_resized(img, rng):
+    keep = rng.randrange(50, 65, 5) / 100
+    q = _quality(rng)
+    size = img.size
+    img = _center_crop(img, keep).resize(size, Image.LANCZOS)
+    return img, [f"crop_keep{int(keep * 100)}", "resized", f"q{q}"], q
+
+
+FAMILIES = [
+    v1_crop_offcenter,
+    v2_crop_bright,
+    v3_resize_scale,
+    v4_rotate,
+    v5_contrast,
+    v6_crop_resized,
+]
+
+
+# ---------------------------------------------------------------------------
+# Random distractors — noise and simple synthetic patterns
+# ---------------------------------------------------------------------------
+
+def make_distractor(rng, max_side):
+    w = rng.randint(max_side // 4, max_side)
+    h = rng.randint(max_side // 4, max_side)
+    kind = rng.choice(["noise", "stripes", "shapes"])
+
+    if kind == "noise":
+        noise = np.random.default_rng(rng.getrandbits(32))
+        img = Image.fromarray(noise.integers(0, 256, (h, w, 3), dtype=np.uint8))
+    elif kind == "stripes":
+        img = Image.new("RGB", (w, h))
+        draw = ImageDraw.Draw(img)
+        period = rng.randint(2, 40)
+        a = tuple(rng.randrange(256) for _ in range(3))
+        b = tuple(rng.randrange(256) for _ in range(3))
+        for y in range(0, h, period):
+            draw.rectangle((0, y, w, y + period // 2), fill=a)
+            draw.rectangle((0, y + period // 2, w, y + period), fill=b)
+        if rng.random() < 0.5:
+            img = img.transpose(Image.ROTATE_90).resize((w, h))
+    else:
+        img = Image.new("RGB", (w, h), tuple(rng.randrange(256) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(rng.randint(5, 40)):
+            x0, y0 = rng.randrange(w), rng.randrange(h)
+            x1 = x0 + rng.randint(5, max(5, w // 2))
+            y1 = y0 + rng.randint(5, max(5, h // 2))
+            fill = tuple(rng.randrange(256) for _ in range(3))
+            if rng.random() < 0.5:
+                draw.ellipse((x0, y0, x1, y1), fill=fill)
+            else:
+                draw.rectangle((x0, y0, x1, y1), fill=fill)
+
+    return img, kind, _quality(rng)
+
+
+# ---------------------------------------------------------------------------
+# Generation — every image gets its own RNG seeded from (seed, index), so
+# output is identical regardless of worker count or chunking
+# ---------------------------------------------------------------------------
+
+_SOURCES = None
+
+
+def _init_worker(sources):
+    global _SOURCES
+    _SOURCES = sources
+
+
+def _shard(index, shard_size):
+    return f"{index // shard_size:04d}"
+
+
+def _write_variant(job):
+    out, index, seed, shard_size = job
+    rng = random.Random(f"variant-{seed}-{index}")
+    stem, source = rng.choice(_SOURCES)
+    family = rng.randrange(len(FAMILIES))
+
+    img, parts, q = FAMILIES[family](source, rng)
+    name = "__".join([stem, *parts, f"v{family + 1}", f"{index:07d}"]) + ".jpg"
+    rel = f"variants/{_shard(index, shard_size)}/{name}"
+    img.save(os.path.join(out, rel), "JPEG", quality=q)
+    return rel, stem
+
+
+def _write_distractor(job):
+    out, index, seed, shard_size, max_side = job
+    rng = random.Random(f"random-{seed}-{index}")
+
+    img, kind, q = make_distractor(rng, max_side)
+    name = f"random_{kind}_{index:07d}.jpg"
+    rel = f"random/{_shard(index, shard_size)}/{name}"
+    img.save(os.path.join(out, rel), "JPEG", quality=q)
+    return rel, None
+
+
+def generate(source, out, n, n_random=None, seed=0, max_side=1024,
+             shard_size=1000, workers=1):
+    """Generate n variants + n_random distractors under `out`, return ground truth."""
+    if n_random is None:
+        n_random = n // 5
+    if shard_size < 1:
+        raise ValueError(f"shard_size must be positive, got {shard_size}")
+    if max_side < MIN_SIDE:
+        raise ValueError(f"max_side must be at least {MIN_SIDE}, got {max_side}")
+
+    sources = load_sources(source, max_side)
+    if not sources:
+        raise ValueError(f"No images found in {source}")
+
+    os.makedirs(os.path.join(out, "originals"), exist_ok=True)
+    for stem, img in sources:
+        img.save(os.path.join(out, "originals", f"{stem}.jpg"), "JPEG", quality=95)
+
+    for i in range(0, n, shard_size):
+        os.makedirs(os.path.join(out, "variants", _shard(i, shard_size)), exist_ok=True)
+    for i in range(0, n_random, shard_size):
+        os.makedirs(os.path.join(out, "random", _shard(i, shard_size)), exist_ok=True)
+
+    variant_jobs = ((out, i, seed, shard_size) for i in range(n))
+    random_jobs = ((out, i, seed, shard_size, max_side) for i in range(n_random))
+
+    ground_truth = {}
+    if workers > 1:
+        with Pool(workers, initializer=_init_worker, initargs=(sources,)) as pool:
+            for rel, label in pool.imap(_write_variant, variant_jobs, chunksize=64):
+                ground_truth[rel] = label
+            for rel, label in pool.imap(_write_distractor, random_jobs, chunksize=64):
+                ground_truth[rel] = label
+    else:
+        _init_worker(sources)
+        for rel, label in map(_write_variant, variant_jobs):
+            ground_truth[rel] = label
+        for rel, label in map(_write_distractor, random_jobs):
+            ground_truth[rel] = label
+
+    with open(os.path.join(out, "ground_truth.json"), "w") as f:
+        json.dump(ground_truth, f, indent=2)
+
+    return ground_truth
+
+
+def _at_least(minimum):
+    """argparse type: an int >= minimum."""
+    def parse(value):
+        number = int(value)
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+        return number
+    return parse
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--source", default="originals", help="folder of original images")
+    parser.add_argument("--out", required=True, help="output folder")
+    parser.add_argument("-n", type=_at_least(0), required=True, help="number of modified variants")
+    parser.add_argument("--random", type=_at_least(0), default=None,
+                        help="number of random distractors (default: n / 5)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-side", type=_at_least(MIN_SIDE), default=1024,
+                        help="downscale originals to this longest side")
+    parser.add_argument("--shard-size", type=_at_least(1), default=1000,
+                        help="images per sub-folder")
+    parser.add_argument("--workers", type=_at_least(1), default=1)
+    args = parser.parse_args()
+
+    gt = generate(
+        args.source, args.out, args.n,
+        n_random=args.random, seed=args.seed, max_side=args.max_side,
+        shard_size=args.shard_size, workers=args.workers,
+    )
+    print(f"Wrote {len(gt)} images + ground_truth.json to: {args.out}")
@@ -219,3 +219,191 @@ def rule4_edge_detection(target_info, input_path):
     evidence = f"Edge score {best_score:.2f}"
 
     return score, fired, evidence
+
+
+
+# Chamfer backend for Rule 4 — target distance transforms are computed once
+# at registration, so each query only samples edge points and looks up costs
+
+CHAMFER_SIZE       = 128   # canonical square size for target edge maps
+CHAMFER_MAX_POINTS = 400   # sampled edge points per side
+CHAMFER_TRUNC      = 3.0   # distances beyond this count as a full miss (px)
+CHAMFER_COARSE     = 4     # coarse search stride (px)
+CHAMFER_SCALES     = (1.0, 0.9, 0.75, 0.6)  # linear crop ratios always tried
+
+
+def _edge_map(img_gray, size):
+    resized = cv2.resize(img_gray, (size, size), interpolation=cv2.INTER_AREA)
+    blurred = cv2.GaussianBlur(resized, (5, 5), 0)
+    return cv2.Canny(blurred, 50, 150)
+
+
+def _distance_map(edges):
+    # distanceTransform measures distance to the nearest zero pixel,
+    # so edges must be 0 and background non-zero
+    return cv2.distanceTransform(255 - edges, cv2.DIST_L2, 3)
+
+
+def _sample_edge_points(edges):
+    ys, xs = np.nonzero(edges)
+    step = max(1, len(xs) // CHAMFER_MAX_POINTS)
+    return ys[::step], xs[::step]
+
+
+def _edge_signature(edges):
+    return {"dist": _distance_map(edges), "points": _sample_edge_points(edges)}
+
+
+def compute_edge_signature(image_path):
+    """
+    Target edge distance transform + sampled edge points (None if unusable).
+    The same target rotated 180 degrees is kept under "null": it has the same
+    edge density but no true alignment, so its cost is the no-match baseline.
+    """
+    img = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return None
+
+    edges = _edge_map(img, CHAMFER_SIZE)
+    if edges.sum() == 0:
+        return None
+
+    sig = _edge_signature(edges)
+    sig["null"] = _edge_signature(cv2.rotate(edges, cv2.ROTATE_180))
+    return sig
+
+
+def _query_template(img_gray, size):
+    """Edge distance transform + sampled edge points of the query at `size`."""
+    edges = _edge_map(img_gray, size)
+    points = _sample_edge_points(edges)
+    if len(points[0]) == 0:
+        return None
+    return {"size": size, "dist": _distance_map(edges), "points": points}
+
+
+def prepare_edge_query(input_path):
+    """
+    Load the input once per search: shrink it, trim dark padding
+    (letterboxed resizes), and build the edge templates for CHAMFER_SCALES.
+    The content size is kept in original pixels for the size-aware template.
+    """
+    img = cv2.imread(input_path, cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return None
+
+    h, w = img.shape
+    work = 2 * CHAMFER_SIZE
+    small = cv2.resize(img, (work, work), interpolation=cv2.INTER_AREA)
+
+    content = cv2.findNonZero((small > 16).astype(np.uint8))
+    if content is None:
+        return None
+    x, y, cw, ch = cv2.boundingRect(content)
+
+    gray = np.ascontiguousarray(small[y:y + ch, x:x + cw])
+    templates = {}
+    for r in CHAMFER_SCALES:
+        size = int(CHAMFER_SIZE * r)
+        templates[size] = _query_template(gray, size)
+
+    return {
+        "gray":      gray,
+        "width":     w * cw / work,
+        "height":    h * ch / work,
+        "templates": templates,
+    }
+
+
+def _chamfer_cost(sig, tmpl, offsets):
+    """Symmetric truncated chamfer cost for each (dy, dx) offset."""
+    size = tmpl["size"]
+    q_dist = tmpl["dist"]
+    dy = offsets[:, 0:1]
+    dx = offsets[:, 1:2]
+
+    # Forward: query edge points -> nearest target edge
+    qy, qx = tmpl["points"]
+    fwd = np.minimum(sig["dist"][qy[None, :] + dy, qx[None, :] + dx], CHAMFER_TRUNC)
+    fwd = fwd.mean(axis=1)
+
+    # Backward: target edge points inside the window -> nearest query edge.
+    # Without this term, a target dense with texture edges matches anything.
+    ty, tx = sig["points"]
+    ry = ty[None, :] - dy
+    rx = tx[None, :] - dx
+    inside = (ry >= 0) & (ry < size) & (rx >= 0) & (rx < size)
+    d = np.minimum(
+        q_dist[np.clip(ry, 0, size - 1), np.clip(rx, 0, size - 1)], CHAMFER_TRUNC
+    )
+    n = inside.sum(axis=1)
+    bwd = np.where(n > 0, (d * inside).sum(axis=1) / np.maximum(n, 1), CHAMFER_TRUNC)
+
+    return (fwd + bwd) / 2.0
+
+
+def _chamfer_search(sig, tmpl):
+    """Coarse-to-fine search for the window offset with the lowest cost."""
+    span = CHAMFER_SIZE - tmpl["size"]
+    coarse = np.arange(0, span + 1, CHAMFER_COARSE)
+    if coarse[-1] != span:
+        coarse = np.append(coarse, span)
+    offsets = np.array([(y, x) for y in coarse for x in coarse])
+    costs = _chamfer_cost(sig, tmpl, offsets)
+    by, bx = offsets[int(np.argmin(costs))]
+
+    # Fine pass: every pixel offset around the best coarse position
+    offsets = np.array([
+        (y, x)
+        for y in range(max(0, by - CHAMFER_COARSE), min(span, by + CHAMFER_COARSE) + 1)
+        for x in range(max(0, bx - CHAMFER_COARSE), min(span, bx + CHAMFER_COARSE) + 1)
+    ])
+    return float(_chamfer_cost(sig, tmpl, offsets).min())
+
+
+def rule4_chamfer_edge(target_info, input_path, query=None):
+    """
+    Rule 4 (20 pts), chamfer backend: average distance from query edge points
+    to the target's precomputed distance transform (and back). Averaging
+    distances instead of correlating binary maps tolerates the 1-2 px edge
+    shifts left behind by JPEG recompression.
+
+    The score is the cost reduction against the rotated-target baseline, so
+    an image with many edges does not score well against every target.
+    """
+    sig = target_info.get("edge_sig")
+    if sig is None:
+        sig = compute_edge_signature(target_info["path"])
+
+    if query is None:
+        query = prepare_edge_query(input_path)
+    if sig is None or query is None:
+        return 0, False, "Edge score 0.00"
+
+    # Size-aware ratio as in Rule 3, plus a fixed ladder of crop ratios
+    # for inputs whose pixel size no longer reflects the crop
+    tw = target_info.get("width") or query["width"]
+    th = target_info.get("height") or query["height"]
+    area_ratio   = (query["width"] * query["height"]) / max(tw * th, 1)
+    linear_ratio = max(0.3, min(0.94, area_ratio ** 0.5))
+
+    templates = dict(query["templates"])
+    size = int(CHAMFER_SIZE * linear_ratio)
+    if size not in templates:
+        templates[size] = _query_template(query["gray"], size)
+
+    best_score = 0.0
+    for tmpl in templates.values():
+        if tmpl is None:
+            continue
+        cost     = _chamfer_search(sig, tmpl)
+        baseline = _chamfer_search(sig["null"], tmpl)
+        if baseline > 0:
+            best_score = max(best_score, 1.0 - cost / baseline)
+
+    best_score = max(0.0, min(1.0, best_score))
+    score  = int(best_score * 20)
+    fired  = score >= 8
+    evidence = f"Edge score {best_score:.2f}"
+
+    return score, fired, evidence
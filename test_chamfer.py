@@ -0,0 +1,69 @@
+import os
+import sys
+
+SCRIPT_DIR    = os.path.dirname(os.path.abspath(__file__))
+ORIGINALS_DIR = os.path.join(SCRIPT_DIR, "originals")
+
+sys.path.insert(0, SCRIPT_DIR)
+from forensics_detective import SimpleDetective
+from rules_v2 import prepare_edge_query, rule4_chamfer_edge
+
+# Hard variants whose edges should clearly point back to their own original
+VARIANTS = [
+    "hard/original_01__resize_scale75__compress__q30__v3.jpg",
+    "hard/original_03__crop_offcenter_keep65__compress__q35__v1.jpg",
+    "hard/original_06__contrast__compress__q35__v5.jpg",
+    "hard/original_09__crop_keep50__resized__q75__v6.jpg",
+]
+
+# Unrelated images with plenty of edges — stripes and noise
+DISTRACTORS = [
+    "random/random_10.jpg",
+    "random/random_noise_00.jpg",
+]
+
+
+def _chamfer_targets():
+    detective = SimpleDetective(use_v2=True, edge_backend="chamfer")
+    devnull = open(os.devnull, "w")
+    sys.stdout = devnull
+    detective.register_targets(ORIGINALS_DIR)
+    sys.stdout = sys.__stdout__
+    devnull.close()
+    return detective.targets
+
+
+def _scores(targets, rel_path):
+    """Rule 4 chamfer (score, fired) of one input against every target."""
+    path = os.path.join(SCRIPT_DIR, rel_path)
+    query = prepare_edge_query(path)
+    return {
+        name: rule4_chamfer_edge(info, path, query=query)[:2]
+        for name, info in targets.items()
+    }
+
+
+def test_variant_scores_own_original_highest():
+    targets = _chamfer_targets()
+    for rel_path in VARIANTS:
+        own = os.path.basename(rel_path).split("__")[0] + ".jpg"
+        scores = _scores(targets, rel_path)
+        own_score, own_fired = scores.pop(own)
+        best_other = max(score for score, _ in scores.values())
+        assert own_fired, f"{rel_path}: Rule 4 did not fire on {own}"
+        assert own_score > best_other, (
+            f"{rel_path}: {own} scored {own_score}, another original {best_other}"
+        )
+
+
+def test_distractors_stay_below_fired_threshold():
+    targets = _chamfer_targets()
+    for rel_path in DISTRACTORS:
+        for name, (score, fired) in _scores(targets, rel_path).items():
+            assert not fired, f"{rel_path}: Rule 4 fired on {name} ({score}/20)"
+
+
+if __name__ == "__main__":
+    test_variant_scores_own_original_highest()
+    test_distractors_stay_below_fired_threshold()
+    print("Chamfer checks passed")
@@ -3,6 +3,7 @@ import sys
 phase_1    = False   # → results_v1.txt     (modified + random, V1)
 phase_hard = False   # → results_v1_hard.txt (hard only, V1)
 phase_2    = True   # → results_v2.txt      (modified + hard + random, V2)
+edge_backend = "template"  # Rule 4 backend: "template" or "chamfer"
 
 SCRIPT_DIR        = os.path.dirname(os.path.abspath(__file__))
 RESULTS_FILE      = os.path.join(SCRIPT_DIR, "results_v1.txt")
@@ -34,7 +35,7 @@ if __name__ == "__main__":
     phase_2 = True    # runs modified_images/ + hard/ + random/ → results_v2.txt
 
     # Phase 2 uses V2 (4 rules), others use V1 (3 rules)
-    detective = SimpleDetective(use_v2=phase_2)
+    detective = SimpleDetective(use_v2=phase_2, edge_backend=edge_backend)
 
     # Suppress register_targets printing
     devnull = open(os.devnull, "w")